@@ -2,15 +2,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import re
 import webbrowser
-import pandas as pd
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
-import requests
-from bs4 import BeautifulSoup
 import json
-from openpyxl.styles import Border, Side, Alignment, Font
 import random
 import string
+from fb_endpoints import ENDPOINTS, build_links
 
 class FacebookLinkGenerator:
     def __init__(self, root):
@@ -70,18 +67,7 @@ class FacebookLinkGenerator:
             self.buttons_frame.columnconfigure(i, weight=1)
         
         # Define endpoints
-        self.endpoints = {
-            "Photos Of": "https://www.facebook.com/{}/photos_of",
-            "Videos Of": "https://www.facebook.com/{}/videos_of",
-            "Stories Of": "https://www.facebook.com/stories/{}",
-            "Groups": "https://www.facebook.com/{}/groups",
-            "Events Joined": "https://www.facebook.com/{}/events",
-            "Games": "https://www.facebook.com/{}/games",
-            "Apps": "https://www.facebook.com/{}/apps",
-            "Liked Photos": "https://www.facebook.com/{}/photos_liked",
-            "Liked Videos": "https://www.facebook.com/{}/videos_liked",
-            "Places Visited": "https://www.facebook.com/{}/places"
-        }
+        self.endpoints = ENDPOINTS
         
         self.create_endpoint_buttons()
         
@@ -170,6 +156,9 @@ class FacebookLinkGenerator:
             return None
 
     def get_facebook_user_id(self, url):
+        import requests
+        from bs4 import BeautifulSoup
+
         html = requests.get(url).text
         soup = BeautifulSoup(html, 'html.parser')
         meta = soup.find('meta', {'property': 'al:ios:url'})
@@ -182,11 +171,11 @@ class FacebookLinkGenerator:
     def create_endpoint_buttons(self):
         row = 0
         col = 0
-        for name, url_template in self.endpoints.items():
+        for name in self.endpoints:
             btn = ttk.Button(
                 self.buttons_frame,
                 text=name,
-                command=lambda url_temp=url_template: self.open_url(url_temp)
+                command=lambda link_type=name: self.open_url(link_type)
             )
             btn.grid(row=row, column=col, pady=5, padx=5, sticky='nsew')
             
@@ -195,16 +184,19 @@ class FacebookLinkGenerator:
                 col = 0
                 row += 1
 
-    def open_url(self, url_template):
+    def open_url(self, link_type):
         user_id = self.user_id_entry.get()
         if not user_id:
             messagebox.showerror("Error", "Please extract user information first")
             return
         
-        url = url_template.format(user_id)
+        url = build_links(user_id)[link_type]
         webbrowser.open(url)
 
     def export_to_excel(self):
+        import pandas as pd
+        from openpyxl.styles import Border, Side, Alignment, Font
+
         user_id = self.user_id_entry.get()
         if not user_id:
             messagebox.showerror("Error", "Please extract user information first")
@@ -221,9 +213,9 @@ class FacebookLinkGenerator:
             'URL': []
         }
         
-        for name, url_template in self.endpoints.items():
+        for name, url in build_links(user_id).items():
             data['Link Type'].append(name)
-            data['URL'].append(url_template.format(user_id))
+            data['URL'].append(url)
         
         df = pd.DataFrame(data)
         
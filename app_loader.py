@@ -0,0 +1,20 @@
+"""Load the link generator scripts as modules for tests and benchmarks.
+
+The script file names are not valid module names, so they cannot be
+imported with a plain import statement.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+APP_PATH = ROOT / 'facebook_link_generator-v2.py'
+
+def load_app(path=APP_PATH, name='facebook_link_generator_v2'):
+    # The scripts import fb_endpoints and fb_timing from next to themselves.
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
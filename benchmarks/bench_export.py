@@ -0,0 +1,94 @@
+"""Compare the write-only openpyxl export against the previous pandas export.
+
+Writes the same header block and link rows with both implementations and
+reports wall time and peak memory for each.
+
+    python benchmarks/bench_export.py [--repeat N]
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app_loader import load_app  # noqa: E402
+
+GIVEN_URL = 'https://www.facebook.com/jane.doe'
+USERNAME = 'jane.doe'
+USER_ID = '100004123456789'
+
+
+def pandas_export(filename, given_url, username, user_id, links):
+    # The export as it was before the write-only backend, kept for comparison.
+    import pandas as pd
+    from openpyxl.styles import Border, Side, Alignment, Font
+
+    df = pd.DataFrame({'Link Type': [name for name, _ in links],
+                       'URL': [url for _, url in links]})
+    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Links', startrow=5, index=False)
+        worksheet = writer.sheets['Links']
+        worksheet.sheet_view.showGridLines = False
+        worksheet.sheet_view.zoomScale = 150
+        worksheet['A1'] = 'Given URL:'
+        worksheet['B1'] = given_url
+        worksheet['A2'] = 'Username:'
+        worksheet['B2'] = username
+        worksheet['A3'] = 'UserID:'
+        worksheet['B3'] = user_id
+        for cell in ['A1', 'A2', 'A3']:
+            worksheet[cell].alignment = Alignment(horizontal='right')
+            worksheet[cell].font = Font(bold=True)
+        for cell in ['B1', 'B2', 'B3']:
+            worksheet[cell].alignment = Alignment(horizontal='left')
+        thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                             top=Side(style='thin'), bottom=Side(style='thin'))
+        for row in worksheet.iter_rows(min_row=1, max_row=3, min_col=1, max_col=2):
+            for cell in row:
+                cell.border = thin_border
+        for row in worksheet.iter_rows(min_row=5, max_row=worksheet.max_row, min_col=1, max_col=worksheet.max_column):
+            for cell in row:
+                cell.border = thin_border
+        for column_cells in worksheet.columns:
+            length = max(len(str(cell.value)) for cell in column_cells)
+            worksheet.column_dimensions[column_cells[0].column_letter].width = length + 2
+
+
+def measure(func, filename, links, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(filename, GIVEN_URL, USERNAME, USER_ID, links)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func(filename, GIVEN_URL, USERNAME, USER_ID, links)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    app = load_app()
+    links = list(app.build_links(USER_ID).items())
+
+    # Warm both import paths so the first timed run is not an import benchmark.
+    import openpyxl  # noqa: F401
+    import pandas  # noqa: F401
+
+    print(f"{'backend':<12}{'ms':>10}{'peak KiB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, func in (('write-only', app.write_links_workbook), ('pandas', pandas_export)):
+            best, peak = measure(func, str(Path(tmp) / f'{label}.xlsx'), links, args.repeat)
+            print(f"{label:<12}{best * 1000:>10.2f}{peak / 1024:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
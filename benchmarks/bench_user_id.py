@@ -0,0 +1,70 @@
+"""Compare the streaming user-ID fast path against the full BeautifulSoup parse.
+
+Runs both extractors over the saved HTML fixtures and reports bytes read,
+parse time and peak memory for each path.
+
+    python benchmarks/bench_user_id.py [--repeat N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+sys.path.insert(0, str(ROOT))
+
+from app_loader import load_app  # noqa: E402
+
+
+def iter_chunks(data, size):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def fast_path(app, data):
+    chunks = iter_chunks(data, app.CHUNK_SIZE)
+    head, user_id = app.scan_head_for_user_id(chunks)
+    if user_id:
+        return user_id, len(head)
+    body = head + b''.join(chunks)
+    return app.parse_user_id_from_html(body.decode('utf-8')), len(body)
+
+
+def soup_path(app, data):
+    return app.parse_user_id_from_html(data.decode('utf-8')), len(data)
+
+
+def measure(func, app, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        user_id, bytes_read = func(app, data)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func(app, data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return user_id, bytes_read, min(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = load_app()
+    fixtures = sorted(FIXTURES.glob('*.html'))
+    width = max(len('fixture'), *(len(fixture.name) for fixture in fixtures)) + 2
+    print(f"{'fixture':<{width}}{'path':<8}{'user id':<18}{'bytes':>10}{'ms':>10}{'peak KiB':>12}")
+    for fixture in fixtures:
+        data = fixture.read_bytes()
+        for label, func in (('fast', fast_path), ('soup', soup_path)):
+            user_id, bytes_read, best, peak = measure(func, app, data, args.repeat)
+            print(f"{fixture.name:<{width}}{label:<8}{user_id:<18}{bytes_read:>10}"
+                  f"{best * 1000:>10.2f}{peak / 1024:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
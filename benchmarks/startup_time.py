@@ -0,0 +1,69 @@
+"""Report time-to-first-window and the slowest imports at application start.
+
+Launches the app under ``python -X importtime``, builds the main window,
+waits for it to be drawn and exits. Needs a display.
+
+    python benchmarks/startup_time.py [--script OLD_facebook_link_generator.py] [--top N]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPTS = {
+    'facebook_link_generator-v2.py': 'FacebookLinkGeneratorOptimized',
+    'OLD_facebook_link_generator.py': 'FacebookLinkGenerator',
+}
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+import tkinter as tk
+from app_loader import load_app
+module = load_app(sys.argv[1], 'app')
+root = tk.Tk()
+getattr(module, sys.argv[2])(root)
+root.update()
+print(f'{(time.perf_counter() - start) * 1000:.1f}')
+root.destroy()
+"""
+
+
+def parse_importtime(stderr):
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        imports.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--script', choices=sorted(SCRIPTS), default='facebook_link_generator-v2.py')
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD, str(ROOT / args.script), SCRIPTS[args.script]],
+        capture_output=True, text=True, cwd=ROOT)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        sys.exit(f"Startup failed:\n{result.stderr.splitlines()[-1] if result.stderr else ''}")
+
+    print(f"{args.script}")
+    print(f"  time to first window: {float(result.stdout.strip()):.1f} ms (in-process)")
+    print(f"  process wall time:    {wall_ms:.1f} ms")
+    print("\n  slowest imports (cumulative ms):")
+    imports = sorted(parse_importtime(result.stderr), reverse=True)
+    for cumulative_us, _, name in imports[:args.top]:
+        print(f"  {cumulative_us / 1000:>9.1f}  {name.strip()}")
+
+
+if __name__ == '__main__':
+    main()
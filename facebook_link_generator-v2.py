@@ -2,20 +2,235 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import re
 import webbrowser
-import pandas as pd
+import importlib
 from datetime import datetime
 from urllib.parse import urlparse
-import requests
-from bs4 import BeautifulSoup
-from openpyxl.styles import Border, Side, Alignment, Font
 import random
 import string
+import threading
+import queue
+import time
+import csv
+import json
+from html import unescape
+from fb_endpoints import ENDPOINTS, build_links
+from fb_timing import LOOKUP_PHASES, Timings
+
+REQUEST_TIMEOUT = 10
+POLL_INTERVAL_MS = 100
+WARM_UP_DELAY_MS = 500
+CHUNK_SIZE = 8192
+TIMEOUT_MESSAGE = "Request timed out after {} seconds"
+
+# A comment matches as a whole once its '-->' has arrived, or as a bare '<!--'
+# while it is still open, so tags inside comments are never mistaken for real ones.
+HEAD_TAG_PATTERN = re.compile(rb'<!--(?:.*?-->)?|<meta\b[^>]*>|</head\s*>',
+                              re.IGNORECASE | re.DOTALL)
+# Attribute names must follow whitespace so data-property= / data-content= don't match.
+IOS_URL_PATTERN = re.compile(rb'\sproperty\s*=\s*["\']al:ios:url["\']', re.IGNORECASE)
+CONTENT_PATTERN = re.compile(rb'\scontent\s*=\s*(["\'])(.*?)\1', re.IGNORECASE | re.DOTALL)
+
+# Heavy dependencies are imported on first use so the window appears quickly;
+# these are pre-loaded in the background once it is up.
+WARM_UP_MODULES = ('requests', 'bs4', 'openpyxl')
+
+def warm_up_imports():
+    for name in WARM_UP_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+def read_chunks(response, deadline=None):
+    """Yield the streamed response body, reporting stalled reads as timeouts.
+
+    With stream=True, requests raises ConnectionError rather than Timeout
+    when a read times out part-way through the body. The requests timeout
+    only bounds each read, so a time.monotonic() deadline for the whole
+    body is checked between chunks.
+    """
+    import requests
+    from urllib3.exceptions import ReadTimeoutError
+
+    try:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if deadline is not None and time.monotonic() > deadline:
+                raise requests.Timeout("Response body took too long to arrive")
+            yield chunk
+    except requests.ConnectionError as e:
+        if e.args and isinstance(e.args[0], ReadTimeoutError):
+            raise requests.ReadTimeout(*e.args, request=e.request, response=e.response) from e
+        raise
+
+def scan_head_for_user_id(chunks):
+    """Scan streamed HTML chunks for the al:ios:url meta tag.
+
+    Stops reading as soon as the tag or </head> is seen and returns the
+    bytes consumed so far together with the user ID, or None if the tag
+    was not found or holds an empty ID. Tags inside HTML comments are
+    skipped.
+    """
+    buffer = bytearray()
+    scan_from = 0
+    for chunk in chunks:
+        buffer += chunk
+        open_comment = None
+        for match in HEAD_TAG_PATTERN.finditer(buffer, scan_from):
+            tag = match.group()
+            if tag.startswith(b'<!--'):
+                if len(tag) == 4:
+                    open_comment = match.start()
+                    break
+                scan_from = match.end()
+                continue
+            scan_from = match.end()
+            if tag.startswith(b'</'):
+                return bytes(buffer), None
+            if IOS_URL_PATTERN.search(tag):
+                # Like the full parse, only the first al:ios:url tag counts.
+                content = CONTENT_PATTERN.search(tag)
+                if not content:
+                    return bytes(buffer), None
+                value = unescape(content.group(2).decode('utf-8', errors='replace'))
+                return bytes(buffer), value.split('/')[-1] or None
+        if open_comment is not None:
+            # Wait for the rest of the comment before scanning past it.
+            scan_from = open_comment
+            continue
+        # Only a tag opened after the last complete match and the last '<'
+        # can still be incomplete.
+        last_open = buffer.rfind(b'<', scan_from)
+        scan_from = last_open if last_open != -1 else len(buffer)
+    return bytes(buffer), None
+
+def parse_user_id_from_html(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    meta = soup.find('meta', {'property': 'al:ios:url'})
+    if meta:
+        user_id = meta.get('content', '').split('/')[-1]
+        if user_id:
+            return user_id
+    return "Unknown"
+
+def write_links_workbook(filename, given_url, username, user_id, links):
+    """Write the header block and link rows to an .xlsx file in one pass.
+
+    Uses openpyxl write-only mode with shared named styles. Column widths
+    are measured as the cells are created, since write-only sheets need
+    them set before the first row is streamed out.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, Side
+    from openpyxl.utils import get_column_letter
+
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    workbook = Workbook(write_only=True)
+    workbook.add_named_style(NamedStyle(name='fb_label', font=Font(bold=True),
+                                        alignment=Alignment(horizontal='right'), border=border))
+    workbook.add_named_style(NamedStyle(name='fb_value', alignment=Alignment(horizontal='left'),
+                                        border=border))
+    workbook.add_named_style(NamedStyle(name='fb_header', font=Font(bold=True),
+                                        alignment=Alignment(horizontal='center'), border=border))
+    workbook.add_named_style(NamedStyle(name='fb_link', border=border))
+
+    worksheet = workbook.create_sheet('Links')
+    worksheet.sheet_view.showGridLines = False
+    worksheet.sheet_view.zoomScale = 150
+
+    rows = []
+    widths = {}
+
+    def add_row(*cells):
+        row = []
+        for column, (value, style) in enumerate(cells, start=1):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.style = style
+            row.append(cell)
+            widths[column] = max(widths.get(column, 0), len(value))
+        rows.append(row)
+
+    add_row(('Given URL:', 'fb_label'), (given_url, 'fb_value'))
+    add_row(('Username:', 'fb_label'), (username, 'fb_value'))
+    add_row(('UserID:', 'fb_label'), (user_id, 'fb_value'))
+    add_row()
+    add_row()
+    add_row(('Link Type', 'fb_header'), ('URL', 'fb_header'))
+    for name, url in links:
+        add_row((name, 'fb_link'), (url, 'fb_link'))
+
+    for column, width in widths.items():
+        worksheet.column_dimensions[get_column_letter(column)].width = width + 2
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(filename)
+
+def write_links_csv(filename, given_url, username, user_id, links):
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Given URL:', given_url])
+        writer.writerow(['Username:', username])
+        writer.writerow(['UserID:', user_id])
+        writer.writerow([])
+        writer.writerow(['Link Type', 'URL'])
+        writer.writerows(links)
+
+def write_links_json(filename, given_url, username, user_id, links):
+    data = {
+        'given_url': given_url,
+        'username': username,
+        'user_id': user_id,
+        'links': [{'type': name, 'url': url} for name, url in links],
+    }
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+def write_links_markdown(filename, given_url, username, user_id, links):
+    def cell(value):
+        return value.replace('|', '\\|')
+
+    lines = [
+        f'**Given URL:** {given_url}  ',
+        f'**Username:** {username}  ',
+        f'**UserID:** {user_id}',
+        '',
+        '| Link Type | URL |',
+        '| --- | --- |',
+    ]
+    lines += [f'| {cell(name)} | {cell(url)} |' for name, url in links]
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+# Export backends shown in the format picker: name -> (file extension, writer).
+# Every writer takes (filename, given_url, username, user_id, links), where
+# links is a list of (link type, url) pairs.
+EXPORTERS = {
+    'Excel': ('xlsx', write_links_workbook),
+    'CSV': ('csv', write_links_csv),
+    'JSON': ('json', write_links_json),
+    'Markdown': ('md', write_links_markdown),
+}
+DEFAULT_EXPORT_FORMAT = 'Excel'
 
 class FacebookLinkGeneratorOptimized:
-    def __init__(self, root):
+    def __init__(self, root, request_timeout=REQUEST_TIMEOUT, warm_up=True,
+                 timings_log=None, show_timings=False):
         self.root = root
+        self.request_timeout = request_timeout
+        self.cancel_event = None
+        self.timings = Timings(timings_log)
+        self.status_var = tk.StringVar() if show_timings else None
         self.configure_gui()
         self.create_widgets()
+        if warm_up:
+            self.root.after(WARM_UP_DELAY_MS, self.start_warm_up)
+
+    def start_warm_up(self):
+        threading.Thread(target=warm_up_imports, daemon=True).start()
 
     def configure_gui(self):
         self.root.title("Facebook Link Generator")
@@ -31,6 +246,11 @@ class FacebookLinkGeneratorOptimized:
                            padding=10)
 
     def create_widgets(self):
+        if self.status_var is not None:
+            status_bar = ttk.Label(self.root, textvariable=self.status_var,
+                                   anchor='w', relief='sunken', padding=(10, 2))
+            status_bar.pack(side='bottom', fill='x')
+
         main_container = ttk.Frame(self.root, padding="20")
         main_container.pack(fill='both', expand=True)
 
@@ -49,10 +269,17 @@ class FacebookLinkGeneratorOptimized:
         ttk.Label(input_frame, text="Enter Facebook Profile URL:").pack(fill='x')
         self.url_entry = ttk.Entry(input_frame, width=50)
         self.url_entry.pack(fill='x', pady=5)
-        self.extract_button = ttk.Button(input_frame, text="Extract Information", 
+        actions_frame = ttk.Frame(input_frame)
+        actions_frame.pack(pady=5)
+        self.extract_button = ttk.Button(actions_frame, text="Extract Information", 
                                          command=self.extract_user_info,
                                          style='TButton')
-        self.extract_button.pack(pady=5)
+        self.extract_button.pack(side='left', padx=5)
+        self.cancel_button = ttk.Button(actions_frame, text="Cancel",
+                                        command=self.cancel_lookup,
+                                        style='TButton',
+                                        state='disabled')
+        self.cancel_button.pack(side='left', padx=5)
         self.create_info_display(input_frame)
         return input_frame
 
@@ -75,10 +302,11 @@ class FacebookLinkGeneratorOptimized:
         return buttons_frame
 
     def create_export_button(self, container):
+        self.export_format = tk.StringVar(value=DEFAULT_EXPORT_FORMAT)
         self.export_button = tk.Button(
             container,
-            text="Export All Links to Excel",
-            command=self.export_to_excel,
+            text="Export All Links",
+            command=self.export_links,
             bg='#1877f2',
             fg='white',
             font=('Helvetica', 10, 'bold'),
@@ -88,20 +316,13 @@ class FacebookLinkGeneratorOptimized:
             state='disabled'
         )
         self.export_button.pack(side='right')
+        format_picker = ttk.Combobox(container, textvariable=self.export_format,
+                                     values=list(EXPORTERS), state='readonly', width=10)
+        format_picker.pack(side='right', padx=10)
+        ttk.Label(container, text="Format:").pack(side='right')
 
     def get_endpoints(self):
-        return {
-            "Photos Of": "https://www.facebook.com/{}/photos_of",
-            "Videos Of": "https://www.facebook.com/{}/videos_of",
-            "Stories Of": "https://www.facebook.com/stories/{}",
-            "Groups": "https://www.facebook.com/{}/groups",
-            "Events Joined": "https://www.facebook.com/{}/events",
-            "Games": "https://www.facebook.com/{}/games",
-            "Apps": "https://www.facebook.com/{}/apps",
-            "Liked Photos": "https://www.facebook.com/{}/photos_liked",
-            "Liked Videos": "https://www.facebook.com/{}/videos_liked",
-            "Places Visited": "https://www.facebook.com/{}/places"
-        }
+        return ENDPOINTS
 
     def extract_user_info(self):
         url = self.url_entry.get().strip()
@@ -109,23 +330,76 @@ class FacebookLinkGeneratorOptimized:
             messagebox.showerror("Error", "Please enter a Facebook profile URL")
             return
 
+        url = self.standardize_url(url)
+        if 'facebook.com' not in url:
+            self.show_error("Please enter a valid Facebook URL")
+            return
+
+        self.toggle_button_state(self.extract_button, 'disabled')
+        self.toggle_button_state(self.cancel_button, 'normal')
+        self.timings.clear(LOOKUP_PHASES)
+        self.refresh_timings()
+        self.cancel_event = threading.Event()
+        results = queue.Queue()
+        deadline = time.monotonic() + self.request_timeout
+        worker = threading.Thread(target=self.lookup_worker,
+                                  args=(url, self.cancel_event, results),
+                                  daemon=True)
+        worker.start()
+        self.root.after(POLL_INTERVAL_MS, self.poll_lookup, self.cancel_event, results, deadline)
+
+    def lookup_worker(self, url, cancel_event, results):
+        # Runs off the Tk thread: must not touch any widget, only the queue.
+        import requests
+
+        try:
+            user_id = self.get_facebook_user_id(url, cancel_event)
+        except requests.Timeout:
+            results.put(('error', TIMEOUT_MESSAGE.format(self.request_timeout)))
+            return
+        except Exception as e:
+            results.put(('error', f"Error processing URL: {str(e)}"))
+            return
+        if not cancel_event.is_set():
+            results.put(('done', (url, user_id)))
+
+    def poll_lookup(self, cancel_event, results, deadline):
+        if cancel_event.is_set():
+            return
+        try:
+            kind, payload = results.get_nowait()
+        except queue.Empty:
+            if time.monotonic() > deadline:
+                # A slow trickle of bytes never trips the per-read timeout,
+                # so give up on the worker here and drop whatever it sends.
+                cancel_event.set()
+                kind, payload = 'error', TIMEOUT_MESSAGE.format(self.request_timeout)
+            else:
+                self.root.after(POLL_INTERVAL_MS, self.poll_lookup, cancel_event, results, deadline)
+                return
+
+        self.cancel_event = None
         try:
-            self.toggle_button_state(self.extract_button, 'disabled')
-            url = self.standardize_url(url)
-            if 'facebook.com' not in url:
-                self.show_error("Please enter a valid Facebook URL")
+            if kind == 'error':
+                self.show_error(payload)
                 return
 
-            user_id = self.get_facebook_user_id(url)
+            url, user_id = payload
             if user_id == "Unknown":
                 self.show_error("User not found or given URL is not correct")
                 return
 
             username = self.extract_username(url)
             self.update_user_info(username, user_id)
-
-        except Exception as e:
-            self.show_error(f"Error processing URL: {str(e)}")
+        finally:
+            self.refresh_timings()
+
+    def cancel_lookup(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_event = None
+        self.toggle_button_state(self.cancel_button, 'disabled')
+        self.toggle_button_state(self.extract_button, 'normal')
 
     def standardize_url(self, url):
         if not url.startswith(('http://', 'https://')):
@@ -134,6 +408,7 @@ class FacebookLinkGeneratorOptimized:
 
     def show_error(self, message):
         messagebox.showerror("Error", message)
+        self.toggle_button_state(self.cancel_button, 'disabled')
         self.toggle_button_state(self.extract_button, 'normal')
 
     def toggle_button_state(self, button, state):
@@ -147,36 +422,53 @@ class FacebookLinkGeneratorOptimized:
         return parts[-1] if parts else ""
 
     def update_user_info(self, username, user_id):
-        self.username_entry.config(state='normal')
-        self.username_entry.delete(0, tk.END)
-        self.username_entry.insert(0, username)
-        self.username_entry.config(state='readonly')
-
-        self.user_id_entry.config(state='normal')
-        self.user_id_entry.delete(0, tk.END)
-        self.user_id_entry.insert(0, user_id)
-        self.user_id_entry.config(state='readonly')
-
-        self.toggle_button_state(self.extract_button, 'normal')
-        self.toggle_button_state(self.export_button, 'normal')
-
-    def get_facebook_user_id(self, url):
-        html = requests.get(url).text
-        soup = BeautifulSoup(html, 'html.parser')
-        meta = soup.find('meta', {'property': 'al:ios:url'})
-        if meta:
-            content = meta['content']
-            return content.split('/')[-1]
-        return "Unknown"
+        with self.timings.span('update_user_info'):
+            self.username_entry.config(state='normal')
+            self.username_entry.delete(0, tk.END)
+            self.username_entry.insert(0, username)
+            self.username_entry.config(state='readonly')
+
+            self.user_id_entry.config(state='normal')
+            self.user_id_entry.delete(0, tk.END)
+            self.user_id_entry.insert(0, user_id)
+            self.user_id_entry.config(state='readonly')
+
+            self.toggle_button_state(self.cancel_button, 'disabled')
+            self.toggle_button_state(self.extract_button, 'normal')
+            self.toggle_button_state(self.export_button, 'normal')
+
+    def refresh_timings(self):
+        if self.status_var is not None:
+            self.status_var.set(self.timings.summary())
+
+    def get_facebook_user_id(self, url, cancel_event=None):
+        import requests
+
+        deadline = time.monotonic() + self.request_timeout
+        # 'fetch' covers the request and the streamed read, including the
+        # cheap <head> scan; 'parse' is only recorded for the fallback parse.
+        with self.timings.span('fetch', cancel_event, url=url) as span:
+            with requests.get(url, timeout=self.request_timeout, stream=True) as response:
+                chunks = read_chunks(response, deadline)
+                body, user_id = scan_head_for_user_id(chunks)
+                if user_id is None:
+                    body += b''.join(chunks)
+                encoding = response.encoding or 'utf-8'
+            span['bytes'] = len(body)
+            span['fast_path'] = user_id is not None
+        if user_id is not None:
+            return user_id
+        with self.timings.span('parse', cancel_event):
+            return parse_user_id_from_html(body.decode(encoding, errors='replace'))
 
     def create_endpoint_buttons(self, container):
         row = 0
         col = 0
-        for name, url_template in self.endpoints.items():
+        for name in self.endpoints:
             btn = ttk.Button(
                 container,
                 text=name,
-                command=lambda url_temp=url_template: self.open_url(url_temp)
+                command=lambda link_type=name: self.open_url(link_type)
             )
             btn.grid(row=row, column=col, pady=5, padx=5, sticky='nsew')
             col += 1
@@ -184,76 +476,57 @@ class FacebookLinkGeneratorOptimized:
                 col = 0
                 row += 1
 
-    def open_url(self, url_template):
+    def open_url(self, link_type):
         user_id = self.user_id_entry.get()
         if not user_id:
             messagebox.showerror("Error", "Please extract user information first")
             return
-        webbrowser.open(url_template.format(user_id))
+        webbrowser.open(build_links(user_id)[link_type])
 
     def export_to_excel(self):
+        self.export_links('Excel')
+
+    def export_links(self, format_name=None):
         user_id = self.user_id_entry.get()
         if not user_id:
             messagebox.showerror("Error", "Please extract user information first")
             return
 
+        format_name = format_name or self.export_format.get()
+        extension, writer = EXPORTERS[format_name]
         username = self.username_entry.get()
         given_url = self.url_entry.get().strip()
         date_str = datetime.now().strftime('%d-%b-%Y')
         random_suffix = ''.join(random.choices(string.ascii_letters + string.digits, k=4))
-        filename = f'fb-linkgen_{username}_{date_str}_{random_suffix}.xlsx'
-
-        data = {
-            'Link Type': [],
-            'URL': []
-        }
-
-        for name, url_template in self.endpoints.items():
-            data['Link Type'].append(name)
-            data['URL'].append(url_template.format(user_id))
+        filename = f'fb-linkgen_{username}_{date_str}_{random_suffix}.{extension}'
 
-        df = pd.DataFrame(data)
+        links = build_links(user_id).items()
 
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Links', startrow=5, index=False)
-                workbook = writer.book
-                worksheet = writer.sheets['Links']
-
-                worksheet.sheet_view.showGridLines = False
-                worksheet.sheet_view.zoomScale = 150
-
-                worksheet['A1'] = 'Given URL:'
-                worksheet['B1'] = given_url
-                worksheet['A2'] = 'Username:'
-                worksheet['B2'] = username
-                worksheet['A3'] = 'UserID:'
-                worksheet['B3'] = user_id
-
-                for cell in ['A1', 'A2', 'A3']:
-                    worksheet[cell].alignment = Alignment(horizontal='right')
-                    worksheet[cell].font = Font(bold=True)
-                for cell in ['B1', 'B2', 'B3']:
-                    worksheet[cell].alignment = Alignment(horizontal='left')
-
-                thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                                     top=Side(style='thin'), bottom=Side(style='thin'))
-                for row in worksheet.iter_rows(min_row=1, max_row=3, min_col=1, max_col=2):
-                    for cell in row:
-                        cell.border = thin_border
-                for row in worksheet.iter_rows(min_row=5, max_row=worksheet.max_row, min_col=1, max_col=worksheet.max_column):
-                    for cell in row:
-                        cell.border = thin_border
-
-                for column_cells in worksheet.columns:
-                    length = max(len(str(cell.value)) for cell in column_cells)
-                    worksheet.column_dimensions[column_cells[0].column_letter].width = length + 2
-
+            with self.timings.span('export', format=format_name):
+                writer(filename, given_url, username, user_id, links)
+            self.refresh_timings()
             messagebox.showinfo("Success", f"Links exported to {filename}")
         except Exception as e:
-            messagebox.showerror("Error", f"Error exporting to Excel: {str(e)}")
+            self.refresh_timings()
+            messagebox.showerror("Error", f"Error exporting to {format_name}: {str(e)}")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Facebook Link Generator")
+    parser.add_argument('--timings-log', metavar='PATH',
+                        help="append lookup and export timings to this JSON lines file")
+    parser.add_argument('--show-timings', action='store_true',
+                        help="show the latest timings in a status bar")
+    args = parser.parse_args()
+    if args.timings_log:
+        try:
+            open(args.timings_log, 'a', encoding='utf-8').close()
+        except OSError as e:
+            parser.error(f"cannot write timings log: {e}")
+
     root = tk.Tk()
-    app = FacebookLinkGeneratorOptimized(root)
+    app = FacebookLinkGeneratorOptimized(root, timings_log=args.timings_log,
+                                         show_timings=args.show_timings)
     root.mainloop()
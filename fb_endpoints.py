@@ -0,0 +1,32 @@
+"""Facebook link endpoints shared by the link generator scripts."""
+from functools import lru_cache
+from types import MappingProxyType
+
+# Link type -> URL template, where '{}' stands for the user ID.
+ENDPOINTS = MappingProxyType({
+    "Photos Of": "https://www.facebook.com/{}/photos_of",
+    "Videos Of": "https://www.facebook.com/{}/videos_of",
+    "Stories Of": "https://www.facebook.com/stories/{}",
+    "Groups": "https://www.facebook.com/{}/groups",
+    "Events Joined": "https://www.facebook.com/{}/events",
+    "Games": "https://www.facebook.com/{}/games",
+    "Apps": "https://www.facebook.com/{}/apps",
+    "Liked Photos": "https://www.facebook.com/{}/photos_liked",
+    "Liked Videos": "https://www.facebook.com/{}/videos_liked",
+    "Places Visited": "https://www.facebook.com/{}/places"
+})
+
+# Templates pre-split around the placeholder so links are built by concatenation.
+SPLIT_TEMPLATES = tuple(
+    (name, *template.split('{}', 1)) for name, template in ENDPOINTS.items()
+)
+
+@lru_cache(maxsize=1)
+def build_links(user_id):
+    """Return a read-only mapping of link type -> URL for user_id.
+
+    Only the most recent user ID is kept, so the links are built once per
+    extracted profile and rebuilt when the ID changes.
+    """
+    return MappingProxyType({name: prefix + user_id + suffix
+                             for name, prefix, suffix in SPLIT_TEMPLATES})
@@ -0,0 +1,78 @@
+"""Lightweight timing spans for the lookup and export phases."""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Phases of one profile lookup; cleared when a new lookup starts.
+LOOKUP_PHASES = ('fetch', 'parse', 'update_user_info')
+# Order in which phases are listed in the status bar summary.
+PHASES = LOOKUP_PHASES + ('export',)
+
+class Timings:
+    """Collect span durations and optionally append them to a JSON lines log.
+
+    Spans may be recorded from the lookup worker thread, so writes to the
+    log file and to the latest-durations table are serialised. If the log
+    file cannot be written, a warning is logged and file logging is turned
+    off; timing never changes what the timed code does.
+
+    Every entry carries an outcome: 'ok', 'error' (with the exception in
+    'error') or 'cancelled' when the span's cancel_event was set by the time
+    it ended. Cancelled spans are logged but do not replace the latest
+    durations shown in the summary.
+    """
+
+    def __init__(self, log_path=None):
+        self.log_path = log_path
+        self.latest = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, phase, cancel_event=None, **fields):
+        start = time.perf_counter()
+        outcome = 'ok'
+        try:
+            yield fields
+        except BaseException as e:
+            outcome = 'error'
+            fields['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if cancel_event is not None and cancel_event.is_set():
+                outcome = 'cancelled'
+            self.record(phase, time.perf_counter() - start, outcome, **fields)
+
+    def record(self, phase, seconds, outcome='ok', **fields):
+        entry = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'phase': phase,
+            'duration_ms': round(seconds * 1000, 3),
+            'outcome': outcome,
+            **fields,
+        }
+        with self._lock:
+            if outcome != 'cancelled':
+                self.latest[phase] = seconds
+            if self.log_path:
+                try:
+                    with open(self.log_path, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(entry) + '\n')
+                except OSError as e:
+                    logger.warning("Disabling timings log %s: %s", self.log_path, e)
+                    self.log_path = None
+
+    def clear(self, phases):
+        with self._lock:
+            for phase in phases:
+                self.latest.pop(phase, None)
+
+    def summary(self):
+        with self._lock:
+            latest = dict(self.latest)
+        return ' | '.join(f"{phase} {latest[phase] * 1000:.1f} ms"
+                          for phase in PHASES if phase in latest)
@@ -0,0 +1,186 @@
+import functools
+import os
+import socket
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = ROOT / 'benchmarks' / 'fixtures'
+sys.path.insert(0, str(ROOT))
+
+from app_loader import load_app  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmarks', action='store_true',
+                     help="run the timed benchmarks (also enabled by FB_LINKGEN_BENCHMARKS=1)")
+    parser.addoption('--update-baselines', action='store_true',
+                     help="run the benchmarks and rewrite tests/benchmark_baselines.json")
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: timed run compared against a stored baseline')
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timings depend on the machine, so benchmarks are opt-in.
+    if (config.getoption('--benchmarks') or config.getoption('--update-baselines')
+            or os.environ.get('FB_LINKGEN_BENCHMARKS') == '1'):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmarks or FB_LINKGEN_BENCHMARKS=1")
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # The streaming extractor hangs up once it has read <head>.
+        pass
+
+
+class FakeEntry:
+    def __init__(self, value=''):
+        self.value = value
+        self.state = 'normal'
+
+    def get(self):
+        return self.value
+
+    def config(self, state):
+        self.state = state
+
+    def delete(self, first, last=None):
+        self.value = ''
+
+    def insert(self, index, text):
+        self.value = text
+
+
+class FakeButton:
+    def __init__(self, state='normal'):
+        self.state = state
+
+    def config(self, state):
+        self.state = state
+
+
+class FakeRoot:
+    """Collects root.after callbacks so tests can run them one at a time."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func, *args):
+        self.pending.append((func, args))
+
+    def run_pending(self):
+        func, args = self.pending.pop(0)
+        func(*args)
+
+    def update_idletasks(self):
+        pass
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    return load_app()
+
+
+@pytest.fixture(scope='session')
+def fixture_server():
+    server = FixtureServer(('127.0.0.1', 0),
+                           functools.partial(QuietHandler, directory=str(FIXTURES)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stalling_server():
+    """A server that sends headers and the start of <head>, then stalls."""
+    listener = socket.create_server(('127.0.0.1', 0))
+    release = threading.Event()
+
+    def serve():
+        connection, _ = listener.accept()
+        with connection:
+            connection.recv(4096)
+            connection.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n'
+                               b'Content-Length: 100000\r\n\r\n<html><head>')
+            release.wait(10)
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield f'http://127.0.0.1:{listener.getsockname()[1]}/'
+    release.set()
+    listener.close()
+
+
+@pytest.fixture
+def trickling_server():
+    """A server that keeps sending <head> padding, one chunk every 50 ms."""
+    listener = socket.create_server(('127.0.0.1', 0))
+    release = threading.Event()
+
+    def serve():
+        connection, _ = listener.accept()
+        with connection:
+            connection.recv(4096)
+            connection.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n'
+                               b'Content-Length: 100000000\r\n\r\n<html><head>')
+            while not release.wait(0.05):
+                try:
+                    connection.sendall(b' ' * 8192)
+                except OSError:
+                    return
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield f'http://127.0.0.1:{listener.getsockname()[1]}/'
+    release.set()
+    listener.close()
+
+
+@pytest.fixture
+def messages(app_module, monkeypatch):
+    calls = []
+    stub = SimpleNamespace(
+        showerror=lambda title, message: calls.append(('error', message)),
+        showinfo=lambda title, message: calls.append(('info', message)),
+    )
+    monkeypatch.setattr(app_module, 'messagebox', stub)
+    return calls
+
+
+@pytest.fixture
+def app(app_module, messages, tmp_path, monkeypatch):
+    """An app instance with fake entry widgets, so no display is needed."""
+    monkeypatch.chdir(tmp_path)
+    app = object.__new__(app_module.FacebookLinkGeneratorOptimized)
+    app.root = FakeRoot()
+    app.request_timeout = 5
+    app.cancel_event = None
+    app.timings = app_module.Timings()
+    app.status_var = None
+    app.endpoints = app.get_endpoints()
+    app.url_entry = FakeEntry('https://www.facebook.com/jane.doe')
+    app.username_entry = FakeEntry('jane.doe')
+    app.user_id_entry = FakeEntry('100004123456789')
+    app.export_format = FakeEntry(app_module.DEFAULT_EXPORT_FORMAT)
+    app.extract_button = FakeButton()
+    app.cancel_button = FakeButton('disabled')
+    app.export_button = FakeButton('disabled')
+    return app
@@ -0,0 +1,74 @@
+"""Timed runs compared against tests/benchmark_baselines.json.
+
+These only run with ``--benchmarks`` or ``FB_LINKGEN_BENCHMARKS=1``. A
+benchmark fails when its best time exceeds the stored baseline by more
+than REGRESSION_FACTOR. Refresh the baselines on a quiet machine with
+``pytest tests/test_benchmarks.py --update-baselines``.
+"""
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import ROOT
+
+BASELINES = Path(__file__).resolve().parent / 'benchmark_baselines.json'
+REGRESSION_FACTOR = 3.0
+REPEAT = 5
+
+COLD_START = "from app_loader import load_app; load_app()"
+
+pytestmark = pytest.mark.benchmark
+
+
+def best_of(func, repeat=REPEAT):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+@pytest.fixture(scope='module')
+def baselines(request):
+    stored = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    measured = {}
+    yield stored, measured
+    if request.config.getoption('--update-baselines') and measured:
+        stored.update({name: round(ms, 2) for name, ms in measured.items()})
+        BASELINES.write_text(json.dumps(stored, indent=2, sort_keys=True) + '\n')
+
+
+def check(baselines, name, elapsed_ms):
+    stored, measured = baselines
+    measured[name] = elapsed_ms
+    if name not in stored:
+        pytest.skip(f"no baseline for {name}; run with --update-baselines")
+    limit = stored[name] * REGRESSION_FACTOR
+    assert elapsed_ms <= limit, (
+        f"{name} took {elapsed_ms:.1f} ms, baseline {stored[name]:.1f} ms "
+        f"(limit {limit:.1f} ms)")
+
+
+def test_single_lookup(app, fixture_server, baselines):
+    url = f'{fixture_server}/profile.html'
+    app.get_facebook_user_id(url)
+
+    check(baselines, 'lookup_ms', best_of(lambda: app.get_facebook_user_id(url)))
+
+
+def test_single_export(app, baselines):
+    app.export_to_excel()
+
+    check(baselines, 'export_ms', best_of(app.export_to_excel))
+
+
+def test_cold_start(baselines):
+    def start():
+        subprocess.run([sys.executable, '-c', COLD_START], check=True, cwd=ROOT)
+
+    check(baselines, 'cold_start_ms', best_of(start, repeat=3))
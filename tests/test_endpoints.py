@@ -0,0 +1,23 @@
+import pytest
+
+from fb_endpoints import ENDPOINTS, build_links
+
+
+def test_links_match_templates():
+    links = build_links('42')
+
+    assert list(links) == list(ENDPOINTS)
+    assert all(links[name] == template.format('42') for name, template in ENDPOINTS.items())
+
+
+def test_links_are_memoized_until_the_id_changes():
+    first = build_links('42')
+
+    assert build_links('42') is first
+    assert build_links('43') is not first
+    assert build_links('43')['Groups'] == 'https://www.facebook.com/43/groups'
+
+
+def test_links_are_read_only():
+    with pytest.raises(TypeError):
+        build_links('42')['Groups'] = 'https://example.com'
@@ -0,0 +1,72 @@
+import csv
+import json
+
+import pytest
+from openpyxl import load_workbook
+
+from fb_endpoints import build_links
+
+
+def exported_file(tmp_path, extension):
+    files = list(tmp_path.glob(f'fb-linkgen_jane.doe_*.{extension}'))
+    assert len(files) == 1
+    return files[0]
+
+
+def test_export_to_excel(app, messages, tmp_path):
+    app.export_to_excel()
+
+    assert messages[0][0] == 'info'
+    worksheet = load_workbook(exported_file(tmp_path, 'xlsx'))['Links']
+    rows = list(worksheet.iter_rows(values_only=True))
+    assert rows[:3] == [
+        ('Given URL:', 'https://www.facebook.com/jane.doe'),
+        ('Username:', 'jane.doe'),
+        ('UserID:', '100004123456789'),
+    ]
+    assert rows[5] == ('Link Type', 'URL')
+    assert rows[6:] == list(build_links('100004123456789').items())
+    assert worksheet['A1'].font.b
+    assert worksheet['B7'].border.left.style == 'thin'
+
+
+def test_export_requires_user_id(app, messages, tmp_path):
+    app.user_id_entry.value = ''
+
+    app.export_to_excel()
+
+    assert messages == [('error', "Please extract user information first")]
+    assert not list(tmp_path.iterdir())
+
+
+def test_export_csv(app, tmp_path):
+    app.export_links('CSV')
+
+    with open(exported_file(tmp_path, 'csv'), newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[2] == ['UserID:', '100004123456789']
+    assert [tuple(row) for row in rows[5:]] == list(build_links('100004123456789').items())
+
+
+def test_export_json(app, tmp_path):
+    app.export_links('JSON')
+
+    data = json.loads(exported_file(tmp_path, 'json').read_text(encoding='utf-8'))
+    assert data['user_id'] == '100004123456789'
+    assert len(data['links']) == len(app.endpoints)
+
+
+def test_export_markdown(app, tmp_path):
+    app.export_links('Markdown')
+
+    text = exported_file(tmp_path, 'md').read_text(encoding='utf-8')
+    assert '| Photos Of | https://www.facebook.com/100004123456789/photos_of |' in text
+
+
+@pytest.mark.parametrize('format_name', ['CSV', 'JSON', 'Markdown'])
+def test_export_uses_selected_format(app, app_module, tmp_path, format_name):
+    app.export_format.value = format_name
+
+    app.export_links()
+
+    exported_file(tmp_path, app_module.EXPORTERS[format_name][0])
@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from conftest import FIXTURES
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('facebook.com/jane.doe', 'https://facebook.com/jane.doe'),
+    ('www.facebook.com/jane.doe', 'https://www.facebook.com/jane.doe'),
+    ('http://facebook.com/jane.doe', 'http://facebook.com/jane.doe'),
+    ('https://facebook.com/jane.doe', 'https://facebook.com/jane.doe'),
+])
+def test_standardize_url(app, url, expected):
+    assert app.standardize_url(url) == expected
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://www.facebook.com/jane.doe', 'jane.doe'),
+    ('https://www.facebook.com/jane.doe/', 'jane.doe'),
+    ('https://www.facebook.com/people/Jane-Doe/100004123456789', '100004123456789'),
+    ('https://www.facebook.com/profile.php?id=100004123456789', ''),
+])
+def test_extract_username(app, url, expected):
+    assert app.extract_username(url) == expected
+
+
+def test_user_id_from_head_uses_fast_path(app, fixture_server):
+    user_id = app.get_facebook_user_id(f'{fixture_server}/profile.html')
+
+    assert user_id == '100004123456789'
+    assert 'parse' not in app.timings.latest
+
+
+def test_user_id_falls_back_to_full_parse(app, fixture_server):
+    user_id = app.get_facebook_user_id(f'{fixture_server}/profile_meta_in_body.html')
+
+    assert user_id == '100009876543210'
+    assert 'parse' in app.timings.latest
+
+
+def test_user_id_unknown_without_meta_tag(app, fixture_server):
+    assert app.get_facebook_user_id(f'{fixture_server}/profile_no_meta.html') == 'Unknown'
+
+
+def test_user_id_unknown_for_empty_id(app, fixture_server):
+    assert app.get_facebook_user_id(f'{fixture_server}/profile_empty_id.html') == 'Unknown'
+    assert 'parse' in app.timings.latest
+
+
+@pytest.mark.parametrize('html', [
+    '<head><meta property="al:ios:url" content="fb://profile/"></head>',
+    '<head><meta property="al:ios:url"></head>',
+])
+def test_parse_user_id_unknown_without_id(app_module, html):
+    assert app_module.parse_user_id_from_html(html) == 'Unknown'
+
+
+def test_stalled_body_is_reported_as_timeout(app, stalling_server):
+    app.request_timeout = 0.3
+    results = queue.Queue()
+
+    app.lookup_worker(stalling_server, threading.Event(), results)
+
+    assert results.get_nowait() == ('error', "Request timed out after 0.3 seconds")
+
+
+def test_trickling_body_hits_total_deadline(app, trickling_server):
+    app.request_timeout = 0.3
+    results = queue.Queue()
+
+    app.lookup_worker(trickling_server, threading.Event(), results)
+
+    assert results.get_nowait() == ('error', "Request timed out after 0.3 seconds")
+
+
+def test_new_lookup_clears_previous_lookup_timings(app, monkeypatch):
+    monkeypatch.setattr(app, 'lookup_worker', lambda *args: None)
+    for phase in ('fetch', 'parse', 'export'):
+        app.timings.record(phase, 0.01)
+
+    app.extract_user_info()
+
+    assert set(app.timings.latest) == {'export'}
+
+
+def test_poll_gives_up_after_deadline(app, messages):
+    cancel_event = threading.Event()
+    app.cancel_event = cancel_event
+
+    app.poll_lookup(cancel_event, queue.Queue(), time.monotonic() - 1)
+
+    assert cancel_event.is_set()
+    assert messages == [('error', "Request timed out after 5 seconds")]
+    assert app.extract_button.state == 'normal'
+    assert not app.root.pending
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 8192])
+def test_scan_head_handles_tags_split_across_chunks(app_module, chunk_size):
+    data = (FIXTURES / 'profile.html').read_bytes()
+    chunks = (data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+
+    head, user_id = app_module.scan_head_for_user_id(chunks)
+
+    assert user_id == '100004123456789'
+    assert len(head) < len(data)
+
+
+def test_scan_head_stops_at_end_of_head(app_module):
+    data = (FIXTURES / 'profile_no_meta.html').read_bytes()
+    chunks = (data[i:i + 64] for i in range(0, len(data), 64))
+
+    head, user_id = app_module.scan_head_for_user_id(chunks)
+
+    assert user_id is None
+    assert b'</head>' in head
+    assert len(head) < len(data)
+
+
+@pytest.mark.parametrize('html, expected', [
+    (b'<head><!-- <meta property="al:ios:url" content="fb://profile/9"> --></head>', None),
+    (b'<head><!-- </head> --><meta property="al:ios:url" content="fb://profile/9"></head>', '9'),
+    (b'<head><!-- unclosed <meta property="al:ios:url" content="fb://profile/9">', None),
+    (b'<head><meta property="al:ios:url" content="fb://profile/"></head>', None),
+    (b'<head><meta property="al:ios:url"><meta property="al:ios:url" content="fb://profile/9"></head>', None),
+    (b'<head><meta data-content="x/1" property="al:ios:url" content="fb://profile/42"></head>', '42'),
+    (b'<head><meta data-property="al:ios:url" content="fb://profile/42"></head>', None),
+])
+@pytest.mark.parametrize('chunk_size', [1, 5, 8192])
+def test_scan_head_skips_comments_and_empty_ids(app_module, html, expected, chunk_size):
+    chunks = (html[i:i + chunk_size] for i in range(0, len(html), chunk_size))
+
+    assert app_module.scan_head_for_user_id(chunks)[1] == expected
@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+
+import pytest
+
+URL = 'https://www.facebook.com/jane.doe'
+
+
+def far_deadline():
+    return time.monotonic() + 60
+
+
+def test_poll_reschedules_until_result_arrives(app):
+    cancel_event = threading.Event()
+    results = queue.Queue()
+
+    app.poll_lookup(cancel_event, results, far_deadline())
+    assert len(app.root.pending) == 1
+
+    results.put(('done', (URL, '100004123456789')))
+    app.root.run_pending()
+
+    assert not app.root.pending
+    assert app.username_entry.get() == 'jane.doe'
+    assert app.user_id_entry.get() == '100004123456789'
+    assert app.user_id_entry.state == 'readonly'
+    assert app.export_button.state == 'normal'
+    assert app.cancel_button.state == 'disabled'
+
+
+def test_poll_shows_worker_error(app, messages):
+    results = queue.Queue()
+    results.put(('error', "Error processing URL: boom"))
+
+    app.poll_lookup(threading.Event(), results, far_deadline())
+
+    assert messages == [('error', "Error processing URL: boom")]
+    assert app.extract_button.state == 'normal'
+    assert app.export_button.state == 'disabled'
+
+
+def test_poll_reports_unknown_user(app, messages):
+    app.user_id_entry.value = ''
+    results = queue.Queue()
+    results.put(('done', (URL, 'Unknown')))
+
+    app.poll_lookup(threading.Event(), results, far_deadline())
+
+    assert messages == [('error', "User not found or given URL is not correct")]
+    assert app.user_id_entry.get() == ''
+    assert app.export_button.state == 'disabled'
+
+
+def test_result_after_cancel_is_dropped(app, messages):
+    app.user_id_entry.value = ''
+    cancel_event = threading.Event()
+    results = queue.Queue()
+    app.cancel_event = cancel_event
+    app.poll_lookup(cancel_event, results, far_deadline())
+
+    app.cancel_lookup()
+    results.put(('done', (URL, '100004123456789')))
+    app.root.run_pending()
+
+    assert cancel_event.is_set()
+    assert not app.root.pending
+    assert not messages
+    assert app.user_id_entry.get() == ''
+    assert app.extract_button.state == 'normal'
+    assert app.cancel_button.state == 'disabled'
+
+
+def test_worker_skips_result_once_cancelled(app, monkeypatch):
+    cancel_event = threading.Event()
+    monkeypatch.setattr(app, 'get_facebook_user_id',
+                        lambda url, cancel_event: cancel_event.set() or '100004123456789')
+    results = queue.Queue()
+
+    app.lookup_worker(URL, cancel_event, results)
+
+    assert results.empty()
+
+
+def test_worker_reports_errors(app, monkeypatch):
+    def fail(url, cancel_event):
+        raise ValueError('bad page')
+
+    monkeypatch.setattr(app, 'get_facebook_user_id', fail)
+    results = queue.Queue()
+
+    app.lookup_worker(URL, threading.Event(), results)
+
+    assert results.get_nowait() == ('error', "Error processing URL: bad page")
+
+
+def test_extract_runs_lookup_off_the_calling_thread(app, monkeypatch):
+    caller = threading.get_ident()
+    seen = {}
+
+    def lookup(url, cancel_event):
+        seen['thread'] = threading.get_ident()
+        return '100004123456789'
+
+    monkeypatch.setattr(app, 'get_facebook_user_id', lookup)
+    app.extract_user_info()
+    assert app.extract_button.state == 'disabled'
+    assert app.cancel_button.state == 'normal'
+
+    for _ in range(100):
+        app.root.run_pending()
+        if not app.root.pending:
+            break
+        time.sleep(0.01)
+
+    assert seen['thread'] != caller
+    assert app.user_id_entry.get() == '100004123456789'
+
+
+@pytest.mark.parametrize('url', ['', 'https://example.com/jane.doe'])
+def test_extract_rejects_bad_urls_without_starting_a_lookup(app, messages, url):
+    app.url_entry.value = url
+
+    app.extract_user_info()
+
+    assert len(messages) == 1
+    assert app.cancel_event is None
+    assert not app.root.pending
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+HEAVY_MODULES = ('requests', 'bs4', 'openpyxl', 'pandas')
+
+CHECK = """
+import sys
+from app_loader import load_app
+load_app(sys.argv[1], 'app')
+print(' '.join(name for name in sys.argv[2:] if name in sys.modules))
+"""
+
+
+@pytest.mark.parametrize('script', ['facebook_link_generator-v2.py', 'OLD_facebook_link_generator.py'])
+def test_heavy_modules_are_not_imported_at_load(script):
+    result = subprocess.run([sys.executable, '-c', CHECK, str(ROOT / script), *HEAVY_MODULES],
+                            capture_output=True, text=True, check=True, cwd=ROOT)
+
+    assert result.stdout.strip() == ''
@@ -0,0 +1,61 @@
+import json
+import threading
+
+import pytest
+
+from fb_timing import LOOKUP_PHASES, PHASES, Timings
+
+
+def test_spans_are_logged_as_json_lines(tmp_path):
+    log_path = tmp_path / 'timings.jsonl'
+    timings = Timings(str(log_path))
+
+    with timings.span('fetch', url='https://www.facebook.com/jane.doe') as span:
+        span['bytes'] = 8192
+
+    entry = json.loads(log_path.read_text(encoding='utf-8'))
+    assert entry['phase'] == 'fetch'
+    assert entry['bytes'] == 8192
+    assert 'fetch' in timings.summary()
+
+
+def test_unwritable_log_does_not_break_spans(tmp_path, caplog):
+    timings = Timings(str(tmp_path / 'missing' / 'timings.jsonl'))
+
+    with timings.span('fetch'):
+        pass
+    with timings.span('export'):
+        pass
+
+    assert timings.log_path is None
+    assert set(timings.latest) == {'fetch', 'export'}
+    assert len(caplog.records) == 1
+
+
+def test_spans_record_outcome(tmp_path):
+    log_path = tmp_path / 'timings.jsonl'
+    timings = Timings(str(log_path))
+    cancel_event = threading.Event()
+
+    with timings.span('fetch'):
+        pass
+    with pytest.raises(TimeoutError):
+        with timings.span('fetch', cancel_event):
+            raise TimeoutError('read timed out')
+    with timings.span('parse', cancel_event):
+        cancel_event.set()
+
+    entries = [json.loads(line) for line in log_path.read_text(encoding='utf-8').splitlines()]
+    assert [entry['outcome'] for entry in entries] == ['ok', 'error', 'cancelled']
+    assert entries[1]['error'] == 'TimeoutError: read timed out'
+    assert 'parse' not in timings.latest
+
+
+def test_clear_drops_only_given_phases():
+    timings = Timings()
+    for phase in PHASES:
+        timings.record(phase, 0.001)
+
+    timings.clear(LOOKUP_PHASES)
+
+    assert timings.summary() == 'export 1.0 ms'